@@ -1,3 +1,5 @@
+import gc
+import weakref
 from typing import Callable, TypedDict, Any, Literal, Annotated
 
 import pytest
@@ -86,6 +88,15 @@ def test_cannot_resolve_literals() -> None:
         container.resolve(T)
 
 
+def test_cannot_resolve_none() -> None:
+    class T:
+        def __init__(self, a: None): ...
+
+    container = Container()
+    with pytest.raises(ResolveError):
+        container.resolve(T)
+
+
 def test_cannot_resolve_literals_as_annotated() -> None:
     class T:
         def __init__(self, a: Annotated[Literal[0], ""]): ...
@@ -146,6 +157,15 @@ def test_must_resolve_classes(to_resolve) -> None:
         container.resolve(to_resolve)
 
 
+def test_must_resolve_alias_to_classes() -> None:
+    class Protocol: ...
+
+    container = Container()
+    container.register_alias(Protocol, [])  # type: ignore[arg-type]
+    with pytest.raises(ResolveError):
+        container.resolve(Protocol)
+
+
 def test_resolve_module_local_referent_fails() -> None:
     class T:
         def __init__(self, registered: "LocalReferent"):
@@ -157,6 +177,22 @@ def test_resolve_module_local_referent_fails() -> None:
         Container().resolve(T)
 
 
+def test_local_referent_does_not_affect_other_annotations() -> None:
+    class T:
+        def __init__(
+            self,
+            resolved_value: "Annotated[Any, Token('A')]",
+            unused: "LocalReferent | None" = None,
+        ):
+            self.resolved_value = resolved_value
+
+    class LocalReferent: ...
+
+    container = Container()
+    container.register_value(Token("A"), "a")
+    assert container.resolve(T).resolved_value == "a"
+
+
 def test_resolve_with_parameters() -> None:
     class Inner: ...
 
@@ -286,3 +322,155 @@ def test_can_see_registered_values():
     assert A not in container
     assert B not in container
     assert C not in container
+
+
+def test_registrations_after_first_resolve_are_used() -> None:
+    class Inner: ...
+
+    class T:
+        def __init__(self, inner: Inner):
+            self.inner = inner
+
+    container = Container()
+    first = container.resolve(T)
+    inner = Inner()
+    container.register_value(Inner, inner)
+    second = container.resolve(T)
+
+    assert first.inner is not inner
+    assert second.inner is inner
+
+
+def test_resolve_rejects_unknown_arguments() -> None:
+    class T:
+        def __init__(self, a, /, b=None): ...
+
+    container = Container()
+    with pytest.raises(TypeError):
+        container.resolve(T, 1, 2, 3)
+    with pytest.raises(TypeError):
+        container.resolve(T, 1, c=3)
+    with pytest.raises(TypeError):
+        container.resolve(T, 1, 2, b=2)
+
+
+def test_last_registration_wins() -> None:
+    class T: ...
+
+    container = Container()
+    instance = T()
+    container.register(T, T)
+    container.register_value(T, instance)
+    assert container.resolve(T) is instance
+
+    container.register(T, T)
+    assert container.resolve(T) is not instance
+
+
+def test_resolve_string_annotated_token() -> None:
+    class T:
+        def __init__(self, resolved_value: "Annotated[Any, Token('A')]"):
+            self.resolved_value = resolved_value
+
+    container = Container()
+    container.register_value(Token("A"), "a")
+    assert container.resolve(T).resolved_value == "a"
+
+
+def test_resolve_without_arguments_fills_every_kind() -> None:
+    class Inner: ...
+
+    class T:
+        def __init__(self, a: Inner, /, b=2, *args, c: Inner, d=4, **kwargs):
+            self.a = a
+            self.b = b
+            self.c = c
+            self.d = d
+            self.args = args
+            self.kwargs = kwargs
+
+    container = Container()
+    inner = Inner()
+    container.register_value(Inner, inner)
+    assert container.resolve(T).__dict__ == {
+        "a": inner,
+        "b": 2,
+        "c": inner,
+        "d": 4,
+        "args": (),
+        "kwargs": {},
+    }
+
+
+def test_aliases_follow_later_registrations() -> None:
+    class Protocol: ...
+
+    class Implementer: ...
+
+    container = Container()
+    container.register_alias(Protocol, Implementer)
+    assert isinstance(container.resolve(Protocol), Implementer)
+    assert isinstance(container.resolve(Protocol), Implementer)
+
+    instance = Implementer()
+    container.register_value(Implementer, instance)
+    assert container.resolve(Protocol) is instance
+
+    container.register(Implementer, Implementer)
+    assert container.resolve(Protocol) is not instance
+
+    container.register_value(Protocol, instance)
+    assert container.resolve(Protocol) is instance
+
+
+def test_resolve_no_argument_class_passes_caller_arguments() -> None:
+    class T: ...
+
+    container = Container()
+    assert isinstance(container.resolve(T), T)
+    with pytest.raises(TypeError):
+        container.resolve(T, 1)
+
+
+def test_unresolvable_arguments_can_be_provided() -> None:
+    class T:
+        def __init__(self, a: Literal[0], b):
+            self.a = a
+            self.b = b
+
+    container = Container()
+    with pytest.raises(ResolveError, match="literal"):
+        container.resolve(T, b=1)
+    assert container.resolve(T, 0, b=1).__dict__ == {"a": 0, "b": 1}
+
+
+def test_resolved_classes_can_be_collected() -> None:
+    class Base: ...
+
+    class T(Base):
+        def __init__(self):
+            super().__init__()
+
+    Container().resolve(T)
+    reference = weakref.ref(T)
+    del T
+    gc.collect()
+    assert reference() is None
+
+
+def test_containers_can_be_weakly_referenced() -> None:
+    container = Container()
+    assert weakref.ref(container)() is container
+
+
+def test_resolve_object_init_class_skips_signature(monkeypatch) -> None:
+    class T: ...
+
+    def fail(*args, **kwargs):
+        raise AssertionError("signature should not be inspected")
+
+    monkeypatch.setattr("inspect.signature", fail)
+    container = Container()
+    assert isinstance(container.resolve(T), T)
+    with pytest.raises(TypeError):
+        container.resolve(T, 1)
@@ -1,4 +1,5 @@
 import pickle
+import weakref
 
 from yellowdi import Token
 
@@ -29,3 +30,19 @@ def test_can_mix_styles_of_tokens():
 def test_same_instances_survives_pickling():
     token = Token("A")
     assert pickle.loads(pickle.dumps(token)) is token
+
+
+def test_tokens_keep_their_name():
+    assert Token("A").name == "A"
+    assert Token().name is None
+
+
+def test_anonymous_tokens_survive_pickling():
+    token = pickle.loads(pickle.dumps(Token()))
+    assert isinstance(token, Token)
+    assert token.name is None
+
+
+def test_tokens_can_be_weakly_referenced():
+    token = Token("A")
+    assert weakref.ref(token)() is token
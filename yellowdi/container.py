@@ -1,5 +1,8 @@
+import functools
 import inspect
+import types
 import typing
+from dataclasses import dataclass
 from inspect import Parameter
 from typing import (
     TypeVar,
@@ -11,11 +14,20 @@ from typing import (
     get_args,
     ForwardRef,
 )
-from collections.abc import Hashable
 
 T = TypeVar("T")
 P = ParamSpec("P")
 
+_MISSING = object()
+_ANNOTATED_T = type(Annotated[int, ""])
+_LITERAL_T = type(Literal[0])
+# Integer opcodes for Parameter.kind, in signature order
+_POSITIONAL_ONLY = int(Parameter.POSITIONAL_ONLY)
+_POSITIONAL_OR_KEYWORD = int(Parameter.POSITIONAL_OR_KEYWORD)
+_VAR_POSITIONAL = int(Parameter.VAR_POSITIONAL)
+_KEYWORD_ONLY = int(Parameter.KEYWORD_ONLY)
+_VAR_KEYWORD = int(Parameter.VAR_KEYWORD)
+
 
 class ResolveError(TypeError):
     def __init__(self, *args):
@@ -24,108 +36,340 @@ class ResolveError(TypeError):
 
 @final
 class Token:
-    _tokens: dict[str, "Token"] = {}
+    __slots__ = ("name", "__weakref__")
 
-    def __init__(self, name: str | None = None):
-        self.name = name
+    _tokens: dict[str, "Token"] = {}
+    name: str | None
 
     def __new__(cls, name: str | None = None) -> "Token":
-        if name is None:
-            return super().__new__(cls)
-        if name not in cls._tokens:
-            cls._tokens[name] = super().__new__(cls)
-        return cls._tokens[name]
+        existing = cls._tokens.get(name) if name is not None else None
+        if existing is not None:
+            return existing
+        token = super().__new__(cls)
+        token.name = name
+        if name is not None:
+            cls._tokens[name] = token
+        return token
 
     def __class_getitem__(cls, item: str) -> "Token":
         return cls(item)
 
     def __reduce__(self) -> tuple:
-        return Token, (self.name,), {}
+        return Token, (self.name,)
+
+
+def _get_type_hints(_type: type[T]) -> dict[str, typing.Any]:
+    module = inspect.getmodule(_type)
+    globalns = vars(module) if module is not None else None
+    type_hints: dict[str, typing.Any] = {}
+    for name, annotation in getattr(_type.__init__, "__annotations__", {}).items():
+        try:
+            type_hints.update(
+                typing.get_type_hints(
+                    types.SimpleNamespace(__annotations__={name: annotation}),
+                    globalns=globalns,
+                    include_extras=True,
+                )
+            )
+        except NameError:
+            pass
+    return type_hints
+
+
+Resolver = Callable[["Container"], typing.Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ResolutionStep:
+    name: str
+    kind: int
+    default: typing.Any
+    resolver: Resolver
+
+
+@dataclass(frozen=True, slots=True)
+class ResolutionPlan:
+    steps: tuple[ResolutionStep, ...]
+    construct: Resolver
+
+
+_OBJECT_INIT_STEPS = (
+    ResolutionStep("args", _VAR_POSITIONAL, Parameter.empty, lambda container: ()),
+    ResolutionStep("kwargs", _VAR_KEYWORD, Parameter.empty, lambda container: {}),
+)
+
+
+def _unresolvable(message: str) -> Resolver:
+    def raise_resolve_error(container: "Container") -> typing.Any:
+        raise ResolveError(message)
+
+    return raise_resolve_error
+
+
+def _compile_constructor(_type: type, steps: tuple[ResolutionStep, ...]) -> Resolver:
+    namespace: dict[str, typing.Any] = {"_type": _type}
+    arguments = []
+    for index, step in enumerate(steps):
+        if step.kind == _VAR_POSITIONAL or step.kind == _VAR_KEYWORD:
+            continue
+        if step.default is not Parameter.empty:
+            namespace[f"_default_{index}"] = step.default
+            value = f"_default_{index}"
+        else:
+            namespace[f"_resolve_{index}"] = step.resolver
+            value = f"_resolve_{index}(container)"
+        if step.kind == _KEYWORD_ONLY:
+            value = f"{step.name}={value}"
+        arguments.append(value)
+
+    source = f"def construct(container):\n    return _type({', '.join(arguments)})\n"
+    exec(source, namespace)
+    return namespace["construct"]
+
+
+def _bind(
+    container: "Container",
+    steps: tuple[ResolutionStep, ...],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+) -> tuple[list[typing.Any], dict[str, typing.Any]]:
+    call_args: list[typing.Any] = []
+    call_kwargs: dict[str, typing.Any] = {}
+    append = call_args.append
+    has_var_keyword = False
+    index = 0
+    arg_count = len(args)
+    for step in steps:
+        name = step.name
+        kind = step.kind
+        if kind <= _POSITIONAL_OR_KEYWORD:
+            if index < arg_count:
+                if kind == _POSITIONAL_OR_KEYWORD and name in kwargs:
+                    raise TypeError(f"multiple values for argument '{name}'")
+                append(args[index])
+                index += 1
+            elif kind == _POSITIONAL_OR_KEYWORD and name in kwargs:
+                append(kwargs.pop(name))
+            else:
+                append(step.resolver(container))
+        elif kind == _KEYWORD_ONLY:
+            if name in kwargs:
+                call_kwargs[name] = kwargs.pop(name)
+            else:
+                call_kwargs[name] = step.resolver(container)
+        elif kind == _VAR_POSITIONAL:
+            call_args.extend(args[index:])
+            index = arg_count
+        else:
+            has_var_keyword = True
+
+    if index < arg_count:
+        raise TypeError("too many positional arguments")
+    if kwargs:
+        if not has_var_keyword:
+            raise TypeError(
+                f"got an unexpected keyword argument '{next(iter(kwargs))}'"
+            )
+        call_kwargs.update(kwargs)
+    return call_args, call_kwargs
 
 
 class Container:
+    __slots__ = (
+        "_values",
+        "_factories",
+        "_plans",
+        "_forward_cache",
+        "_aliases",
+        "__weakref__",
+    )
+
     def __init__(self):
-        self._registrations = {}
+        self._values: dict[typing.Any, typing.Any] = {}
+        self._factories: dict[typing.Any, Callable[[], typing.Any]] = {}
+        self._plans: dict[type, ResolutionPlan] = {}
+        self._forward_cache: dict[tuple[int, str], type] = {}
+        self._aliases: dict[typing.Any, type] = {}
 
     def resolve(self, _type: type[T], *args: P.args, **kwargs: P.kwargs) -> T:
-        if not isinstance(_type, Hashable):
-            raise ResolveError("Can only resolve classes")
-        if not inspect.isclass(_type):
-            raise ResolveError("Can only resolve classes")
+        try:
+            value = self._values.get(_type, _MISSING)
+        except TypeError:
+            raise ResolveError("Can only resolve classes") from None
+        if value is not _MISSING:
+            return value
+        factory = self._factories.get(_type)
+        if factory is not None:
+            return factory()
+
+        plan = self._plans.get(_type)
+        if plan is None:
+            plan = self._build_plan(_type)
 
-        if _type in self._registrations:
-            return self._registrations[_type]()
+        if not args and not kwargs:
+            return plan.construct(self)
+        call_args, call_kwargs = _bind(self, plan.steps, args, kwargs)
+        return _type(*call_args, **call_kwargs)
 
+    def _build_plan(self, _type: type[T]) -> ResolutionPlan:
+        if not inspect.isclass(_type):
+            raise ResolveError("Can only resolve classes")
         if type(_type) is not type:
             raise ResolveError("Cannot auto-resolve classes with custom meta-class")
 
-        bound = inspect.signature(_type.__init__).bind_partial(None, *args, **kwargs)
-        for parameter in bound.signature.parameters.values():
-            if parameter.name not in bound.arguments:
-                bound.arguments[parameter.name] = self._resolve_argument(
-                    _type, parameter
-                )
+        if _type.__init__ is object.__init__:
+            plan = ResolutionPlan(_OBJECT_INIT_STEPS, lambda container: _type())
+        else:
+            parameters = tuple(inspect.signature(_type.__init__).parameters.values())
+            if len(parameters) == 1:
+                plan = ResolutionPlan((), lambda container: _type())
+            else:
+                steps = self._build_steps(_type, parameters, _get_type_hints(_type))
+                plan = ResolutionPlan(steps, _compile_constructor(_type, steps))
+        self._plans[_type] = plan
+        return plan
 
-        return _type(*bound.args[1:], **bound.kwargs)
+    def _build_steps(
+        self,
+        _type: type,
+        parameters: tuple[Parameter, ...],
+        type_hints: dict[str, typing.Any],
+    ) -> tuple[ResolutionStep, ...]:
+        return tuple(
+            ResolutionStep(
+                parameter.name,
+                int(parameter.kind),
+                parameter.default,
+                self._build_resolver(
+                    _type,
+                    parameter,
+                    type_hints.get(parameter.name, parameter.annotation),
+                ),
+            )
+            for parameter in parameters[1:]
+        )
 
-    def _resolve_argument(self, _type: type[T], argument: Parameter) -> typing.Any:
+    def _build_resolver(
+        self, _type: type, argument: Parameter, type_annotation: typing.Any
+    ) -> Resolver:
         if argument.default is not Parameter.empty:
-            return argument.default
+            default = argument.default
+            return lambda container: default
         if argument.kind is Parameter.VAR_POSITIONAL:
-            return ()
+            return lambda container: ()
         if argument.kind is Parameter.VAR_KEYWORD:
-            return {}
-        type_annotation = argument.annotation
+            return lambda container: {}
 
         if type_annotation is Parameter.empty:
-            raise ResolveError(
+            return _unresolvable(
                 f"Cannot resolve argument {argument.name} for {_type.__name__}: no type annotation"
             )
-        if typing.get_origin(type_annotation) is Annotated:
+        if type(type_annotation) is _ANNOTATED_T:
             annotations = get_args(type_annotation)
-            type_annotation = annotations[0]
+            resolve_type = self._build_type_resolver(_type, argument, annotations[0])
+            tokens = tuple(
+                annotation
+                for annotation in annotations[1:]
+                if isinstance(annotation, Token)
+            )
+            if not tokens:
+                return resolve_type
+
+            def resolve_annotated(container: "Container") -> typing.Any:
+                for token in tokens:
+                    value = container._values.get(token, _MISSING)
+                    if value is not _MISSING:
+                        return value
+                    factory = container._factories.get(token)
+                    if factory is not None:
+                        return factory()
+                return resolve_type(container)
 
-            for annotation in annotations[1:]:
-                if isinstance(annotation, Token) and annotation in self._registrations:
-                    return self._registrations[annotation]()
+            return resolve_annotated
+        return self._build_type_resolver(_type, argument, type_annotation)
 
-        if typing.get_origin(type_annotation) is Literal:
-            raise ResolveError(
+    def _build_type_resolver(
+        self, _type: type, argument: Parameter, type_annotation: typing.Any
+    ) -> Resolver:
+        if type(type_annotation) is _LITERAL_T:
+            return _unresolvable(
                 f"Cannot resolve argument {argument.name} for {_type.__name__}: literal"
             )
-        if isinstance(type_annotation, str):
-            return self._resolve_forward_declaration(
-                _type, argument.name, type_annotation
+        if type_annotation is None or type_annotation is types.NoneType:
+            return _unresolvable(
+                f"Cannot resolve argument {argument.name} for {_type.__name__}: None"
             )
         if isinstance(type_annotation, ForwardRef):
-            return self._resolve_forward_declaration(
-                _type, argument.name, type_annotation.__forward_arg__
+            type_annotation = type_annotation.__forward_arg__
+        if isinstance(type_annotation, str):
+            class_name = type_annotation
+            module = inspect.getmodule(_type)
+            return lambda container: container._resolve_forward_declaration(
+                _type, argument.name, module, class_name
             )
-        return self.resolve(type_annotation)
+        return lambda container: container.resolve(type_annotation)
 
     def _resolve_forward_declaration(
-        self, _type: type[T], argument_name: str, class_name: str
+        self,
+        _type: type[T],
+        argument_name: str,
+        module: types.ModuleType | None,
+        class_name: str,
     ) -> typing.Any:
-        try:
-            resolved_type = getattr(inspect.getmodule(_type), class_name)
-        except AttributeError:
-            raise ResolveError(
-                f"Cannot resolve argument {argument_name} for {_type.__name__}: "
-                "class declaration not available in module"
-            )
+        key = (id(module), class_name)
+        resolved_type = self._forward_cache.get(key)
+        if resolved_type is None:
+            try:
+                resolved_type = getattr(module, class_name)
+            except AttributeError:
+                raise ResolveError(
+                    f"Cannot resolve argument {argument_name} for {_type.__name__}: "
+                    "class declaration not available in module"
+                )
+            self._forward_cache[key] = resolved_type
         return self.resolve(resolved_type)
 
     def register_value(self, _type: type[T] | Token, value: T) -> None:
-        self.register(_type, lambda: value)
+        self._factories.pop(_type, None)
+        self._values[_type] = value
+        self._reset_aliases(_type)
 
     def register(self, _type: type[T] | Token, factory: Callable[[], T]) -> None:
-        self._registrations[_type] = factory
+        self._values.pop(_type, None)
+        self._factories[_type] = factory
+        self._reset_aliases(_type)
 
     def register_alias(self, _type: type[T], alias: type[T]) -> None:
-        self.register(_type, lambda: self.resolve(alias))
+        self.register(_type, functools.partial(self._resolve_alias, _type, alias))
+        self._aliases[_type] = alias
+
+    def _resolve_alias(self, _type: type[T], alias: type[T]) -> T:
+        try:
+            registered = alias in self._values or alias in self._factories
+        except TypeError:
+            raise ResolveError("Can only resolve classes") from None
+        if registered:
+            return self.resolve(alias)
+        plan = self._plans.get(alias)
+        if plan is None:
+            plan = self._build_plan(alias)
+        self._factories[_type] = functools.partial(plan.construct, self)
+        return plan.construct(self)
+
+    def _reset_aliases(self, _type: typing.Any) -> None:
+        self._aliases.pop(_type, None)
+        for source, target in self._aliases.items():
+            if target is _type:
+                self._factories[source] = functools.partial(
+                    self._resolve_alias, source, target
+                )
 
     def __contains__(self, item) -> bool:
-        return item in self._registrations
+        return item in self._values or item in self._factories
 
     def clear(self):
-        self._registrations.clear()
+        self._values.clear()
+        self._factories.clear()
+        self._plans.clear()
+        self._forward_cache.clear()
+        self._aliases.clear()